@@ -3,54 +3,169 @@
 Generate the Technical Design Deck (.pptx) for this repository.
 
 Outputs:
-  - docs/diagrams/*.png  (rendered from docs/diagrams/*.dot via Graphviz 'dot')
+  - docs/diagrams/*.svg, *.png  (rendered from docs/diagrams/*.dot via Graphviz 'dot')
   - docs/CounterUAS_RadarTracker_TDD.pptx
 """
 
 from __future__ import annotations
 
-import json
+import argparse
+import contextlib
+import copy
+import functools
+import io
 import os
+import shutil
 import subprocess
-from dataclasses import dataclass
+import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from pptx import Presentation
 from pptx.dml.color import RGBColor
+from pptx.opc import serialized as pptx_serialized
 from pptx.enum.text import PP_ALIGN
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
 from pptx.util import Inches, Pt
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json accepts UTF-8 bytes too.
+    from json import loads as _json_loads
+
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 DOCS_DIR = REPO_ROOT / "docs"
 DIAGRAMS_DIR = DOCS_DIR / "diagrams"
 OUT_PPTX = DOCS_DIR / "CounterUAS_RadarTracker_TDD.pptx"
+CONFIG_PATH = REPO_ROOT / "config" / "tracker_config.json"
+OXIPNG = shutil.which("oxipng")
+DIAGRAM_FORMATS = (".svg", ".png")
+# Zip settings per save mode, applied to the XML/SVG parts. The deck is mostly
+# small XML parts plus already-compressed images, so deflate level 1 costs a
+# fraction of the default level for a near-identical size; "fast" skips
+# compression for local iteration and "dist" deflates the XML at level 9.
+# Media in PRECOMPRESSED_SUFFIXES is always stored: the data is already
+# deflated, and a second pass at level 9 can come out larger than level 1.
+PRECOMPRESSED_SUFFIXES = (".png", ".jpg", ".jpeg")
+SAVE_MODES = {
+    "fast": (zipfile.ZIP_STORED, None),
+    "default": (zipfile.ZIP_DEFLATED, 1),
+    "dist": (zipfile.ZIP_DEFLATED, 9),
+}
+
+# Office 2016+ SVG picture extension; the PNG stays in place as the fallback.
+SVG_BLIP_EXT_URI = "{96DAC541-7B7A-43D3-8B79-37D633B846F1}"
+SVG_BLIP_NS = "http://schemas.microsoft.com/office/drawing/2016/SVG/main"
 
 
 BRAND_DARK = RGBColor(15, 23, 42)     # slate-900
 BRAND_MUTED = RGBColor(71, 85, 105)   # slate-600
 BRAND_ACCENT = RGBColor(2, 132, 199)  # sky-600
+BRAND_BORDER = RGBColor(226, 232, 240)  # slate-200
+
 
+# This script holds no descriptors a child should not see, so skip the
+# close-every-fd walk on POSIX spawns; Windows keeps subprocess defaults.
+_SPAWN_KWARGS = (
+    {"close_fds": False, "stdin": subprocess.DEVNULL, "stdout": subprocess.DEVNULL}
+    if os.name == "posix"
+    else {}
+)
 
-def _run(cmd: Sequence[str], cwd: Optional[Path] = None) -> None:
-    subprocess.run(list(cmd), cwd=str(cwd) if cwd else None, check=True)
+
+def _run(cmd: Sequence[str], cwd: Optional[Path] = None, check: bool = True) -> None:
+    result = subprocess.run(
+        list(cmd), cwd=str(cwd) if cwd else None, stderr=subprocess.PIPE, **_SPAWN_KWARGS
+    )
+    # Forward diagnostics in one write so parallel workers do not interleave.
+    if result.stderr:
+        sys.stderr.write(result.stderr.decode(errors="replace"))
+    if check:
+        result.check_returncode()
+
+
+def _pool_size() -> int:
+    # Honour CPU affinity (containers, CI runners) rather than the host CPU count.
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _is_up_to_date(output: Path, source: Path) -> bool:
+    return output.exists() and output.stat().st_mtime >= source.stat().st_mtime
+
+
+def _render_batch(dots: Sequence[Path]) -> List[Path]:
+    """Render, rename and optimize one batch of diagrams on a single worker.
+
+    The stages run back to back on the same thread, so there is no second
+    pool pass (and no extra round of waits) for the PNG optimizer.
+    """
+    # One `dot` process per batch amortizes Graphviz start-up (plugins, fonts),
+    # and each layout is computed once for both output formats.
+    # `-O` writes `<name>.dot.<fmt>` next to each input; rename to `<name>.<fmt>`.
+    _run(["dot", "-Tsvg", "-Tpng", "-O", *(d.name for d in dots)], cwd=DIAGRAMS_DIR)
+    pngs: List[Path] = []
+    for dot in dots:
+        for ext in DIAGRAM_FORMATS:
+            dot.with_name(f"{dot.name}{ext}").replace(dot.with_suffix(ext))
+        pngs.append(dot.with_suffix(".png"))
+    # Graphviz PNGs are not optimally compressed; shrink them losslessly
+    # before they are embedded. Optional: skipped if oxipng is absent.
+    if OXIPNG:
+        _run([OXIPNG, "-q", "-o", "4", "--strip", "safe", *map(str, pngs)], check=False)
+    return pngs
 
 
 def render_diagrams() -> List[Path]:
     DIAGRAMS_DIR.mkdir(parents=True, exist_ok=True)
     rendered: List[Path] = []
+    dots: List[Path] = []
     for dot in sorted(DIAGRAMS_DIR.glob("*.dot")):
-        png = dot.with_suffix(".png")
-        _run(["dot", "-Tpng", str(dot), "-o", str(png)], cwd=REPO_ROOT)
-        rendered.append(png)
-    return rendered
+        if all(_is_up_to_date(dot.with_suffix(ext), dot) for ext in DIAGRAM_FORMATS):
+            rendered.append(dot.with_suffix(".png"))
+        else:
+            dots.append(dot)
+    if not dots:
+        return rendered
+    workers = min(_pool_size(), len(dots))
+    batches = [dots[i::workers] for i in range(workers)]
+    # Each batch is an independent chain of child processes; threads only wait on them.
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for pngs in pool.map(_render_batch, batches):
+            rendered.extend(pngs)
+    return sorted(rendered)
+
+
+@functools.lru_cache(maxsize=1)
+def load_tracker_config() -> dict:
+    """Parsed tracker config, cached per process; treat it as read-only.
 
+    Call ``load_tracker_config.cache_clear()`` after the file changes.
+    """
+    return _json_loads(CONFIG_PATH.read_bytes())
 
-def load_tracker_config() -> dict:
-    cfg_path = REPO_ROOT / "config" / "tracker_config.json"
-    with cfg_path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+
+_MISSING = object()
+
+
+def _dig(cfg: dict, path: str, default="n/a"):
+    """Look up a dotted ``path`` in nested config dicts, or return ``default``."""
+    node = cfg
+    for key in path.split("."):
+        if not isinstance(node, dict):
+            return default
+        node = node.get(key, _MISSING)
+        if node is _MISSING:
+            return default
+    return node
 
 
 @dataclass(frozen=True)
@@ -59,20 +174,38 @@ class SlideTheme:
     body_size_pt: int = 18
     small_size_pt: int = 14
     margin_in: float = 0.6
+    # Derived EMU geometry, computed once per theme instead of per shape.
+    left_emu: int = field(init=False, repr=False, compare=False)
+    width_emu: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "left_emu", Inches(self.margin_in))
+        object.__setattr__(self, "width_emu", Inches(13.333 - 2 * self.margin_in))
+
+
+# Layout and font sizes take only a handful of distinct values per deck.
+@functools.lru_cache(maxsize=32)
+def _pt(size_pt: float) -> Pt:
+    return Pt(size_pt)
+
+
+@functools.lru_cache(maxsize=32)
+def _inches(value: float) -> Inches:
+    return Inches(value)
 
 
 def _set_run_font(run, size_pt: int, color: RGBColor, bold: bool = False) -> None:
-    run.font.size = Pt(size_pt)
+    run.font.size = _pt(size_pt)
     run.font.bold = bold
     run.font.color.rgb = color
     run.font.name = "Calibri"
 
 
 def add_title(slide, title: str, theme: SlideTheme) -> None:
-    left = Inches(theme.margin_in)
-    top = Inches(0.3)
-    width = Inches(13.333 - 2 * theme.margin_in)
-    height = Inches(0.9)
+    left = theme.left_emu
+    top = _inches(0.3)
+    width = theme.width_emu
+    height = _inches(0.9)
     box = slide.shapes.add_textbox(left, top, width, height)
     tf = box.text_frame
     tf.clear()
@@ -84,10 +217,10 @@ def add_title(slide, title: str, theme: SlideTheme) -> None:
 
 
 def add_subtitle(slide, text: str, theme: SlideTheme, *, top_in: float = 1.25) -> None:
-    left = Inches(theme.margin_in)
-    top = Inches(top_in)
-    width = Inches(13.333 - 2 * theme.margin_in)
-    height = Inches(0.8)
+    left = theme.left_emu
+    top = _inches(top_in)
+    width = theme.width_emu
+    height = _inches(0.8)
     box = slide.shapes.add_textbox(left, top, width, height)
     tf = box.text_frame
     tf.clear()
@@ -98,24 +231,76 @@ def add_subtitle(slide, text: str, theme: SlideTheme, *, top_in: float = 1.25) -
     _set_run_font(r, theme.body_size_pt, BRAND_MUTED, bold=False)
 
 
+@functools.lru_cache(maxsize=None)
+def _bullet_template(theme: SlideTheme):
+    return parse_xml(
+        f'<a:p {nsdecls("a")}><a:pPr lvl="0"><a:spcAft><a:spcPts val="600"/></a:spcAft></a:pPr>'
+        f'<a:r><a:rPr sz="{theme.body_size_pt * 100}" b="0"><a:solidFill><a:srgbClr val="{BRAND_DARK}"/>'
+        f'</a:solidFill><a:latin typeface="Calibri"/></a:rPr><a:t/></a:r></a:p>'
+    )
+
+
+def _make_p(template, text: str):
+    p = copy.deepcopy(template)
+    p[-1][-1].text = text  # <a:p>/<a:r>/<a:t>, fixed by the template layout
+    return p
+
+
 def add_bullets(slide, title: str, bullets: Sequence[str], theme: SlideTheme) -> None:
+    """Title plus bullet list.
+
+    The title keeps its own non-wrapping box, as on diagram slides. Bullet
+    paragraphs are cloned from a pre-styled template instead of going
+    through the per-property python-pptx setters, which each re-walk the
+    run tree.
+    """
     add_title(slide, title, theme)
-    left = Inches(theme.margin_in)
-    top = Inches(1.35)
-    width = Inches(13.333 - 2 * theme.margin_in)
-    height = Inches(6.8 - 1.35)
-    box = slide.shapes.add_textbox(left, top, width, height)
+    top = _inches(1.35)
+    height = _inches(6.8 - 1.35)
+    box = slide.shapes.add_textbox(theme.left_emu, top, theme.width_emu, height)
     tf = box.text_frame
     tf.word_wrap = True
-    tf.clear()
-    for i, b in enumerate(bullets):
-        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-        p.text = b
-        p.level = 0
-        p.space_after = Pt(6)
-        p.font.size = Pt(theme.body_size_pt)
-        p.font.color.rgb = BRAND_DARK
-        p.font.name = "Calibri"
+    txBody = tf._txBody
+    for existing in txBody.findall(qn("a:p")):
+        txBody.remove(existing)
+    bullet = _bullet_template(theme)
+    txBody.extend(_make_p(bullet, b) for b in bullets)
+
+
+# Rendered diagram bytes, keyed by path, so a diagram is read from disk once
+# however many slides embed it.
+_PNG_CACHE: Dict[Path, bytes] = {}
+
+
+def _png_bytes(path: Path) -> bytes:
+    data = _PNG_CACHE.get(path)
+    if data is None:
+        data = _PNG_CACHE[path] = path.read_bytes()
+    return data
+
+
+def _attach_svg(slide, pic, svg_path: Path) -> None:
+    """Embed ``svg_path`` as the vector source of ``pic``.
+
+    python-pptx has no SVG support, so the SVG is added as its own media part
+    and referenced from an ``asvg:svgBlip`` extension on the picture's blip.
+    Viewers without SVG support keep rendering the PNG.
+    """
+    package = slide.part.package
+    svg_part = Part(
+        package.next_partname("/ppt/media/image%d.svg"),
+        "image/svg+xml",
+        package,
+        svg_path.read_bytes(),
+    )
+    r_id = slide.part.relate_to(svg_part, RT.IMAGE)
+    blip = pic._element.blipFill.find(qn("a:blip"))
+    blip.append(
+        parse_xml(
+            f'<a:extLst {nsdecls("a", "r")}><a:ext uri="{SVG_BLIP_EXT_URI}">'
+            f'<asvg:svgBlip xmlns:asvg="{SVG_BLIP_NS}" r:embed="{r_id}"/></a:ext></a:extLst>'
+        )
+    )
 
 
 def add_diagram_slide(
@@ -128,19 +313,25 @@ def add_diagram_slide(
     add_title(slide, title, theme)
 
     # Reserve space for title and (optional) caption.
-    left = Inches(theme.margin_in)
-    top = Inches(1.2)
-    width = Inches(13.333 - 2 * theme.margin_in)
-    height = Inches(6.6 - (0.5 if caption else 0.0))
+    left = theme.left_emu
+    top = _inches(1.2)
+    width = theme.width_emu
+    height = _inches(6.6 - (0.5 if caption else 0.0))
 
-    pic = slide.shapes.add_picture(str(image_path), left, top, width=width, height=height)
-    pic.line.color.rgb = RGBColor(226, 232, 240)  # slate-200
+    pic = slide.shapes.add_picture(
+        io.BytesIO(_png_bytes(image_path)), left, top, width=width, height=height
+    )
+    pic._element.nvPicPr.cNvPr.set("descr", image_path.name)  # streams default to "image.png"
+    svg_path = image_path.with_suffix(".svg")
+    if svg_path.exists():
+        _attach_svg(slide, pic, svg_path)
+    pic.line.color.rgb = BRAND_BORDER
 
     if caption:
-        c_left = Inches(theme.margin_in)
-        c_top = Inches(7.1)
-        c_width = Inches(13.333 - 2 * theme.margin_in)
-        c_height = Inches(0.3)
+        c_left = theme.left_emu
+        c_top = _inches(7.1)
+        c_width = theme.width_emu
+        c_height = _inches(0.3)
         c = slide.shapes.add_textbox(c_left, c_top, c_width, c_height)
         tf = c.text_frame
         tf.clear()
@@ -151,7 +342,7 @@ def add_diagram_slide(
         _set_run_font(r, theme.small_size_pt, BRAND_MUTED, bold=False)
 
 
-def build_deck() -> None:
+def build_deck(save_mode: str = "default") -> None:
     theme = SlideTheme()
     prs = Presentation()
     prs.slide_width = Inches(13.333)
@@ -269,8 +460,6 @@ def build_deck() -> None:
     )
 
     # Slide 10: Prediction (IMM)
-    pred = cfg.get("prediction", {})
-    imm = pred.get("imm", {})
     s = prs.slides.add_slide(blank)
     add_bullets(
         s,
@@ -279,13 +468,12 @@ def build_deck() -> None:
             "IMM models: CV, CA1, CA2, CTR1, CTR2 (all 9D Cartesian).",
             "Interaction (mixing) step uses transition matrix and current mode probabilities.",
             "Each model predicts its own (x,P); estimates are merged by mode probabilities.",
-            f"Config: numModels={imm.get('numModels', 'n/a')}  •  initialModeProbabilities={imm.get('initialModeProbabilities', 'n/a')}",
+            f"Config: numModels={_dig(cfg, 'prediction.imm.numModels')}  •  initialModeProbabilities={_dig(cfg, 'prediction.imm.initialModeProbabilities')}",
         ],
         theme,
     )
 
     # Slide 11: Association
-    assoc = cfg.get("association", {})
     s = prs.slides.add_slide(blank)
     add_bullets(
         s,
@@ -294,9 +482,9 @@ def build_deck() -> None:
             "Measurement space: Cartesian position (x,y,z) with H selecting position from the 9D state.",
             "Gating: Mahalanobis distance computed with innovation covariance S = HPHᵀ + R.",
             "Methods:",
-            f"  - Mahalanobis NN: greedy nearest-neighbor with distanceThreshold={assoc.get('mahalanobis', {}).get('distanceThreshold', 'n/a')}",
-            f"  - GNN: global assignment (reduced-cost greedy/Hungarian-like) with costThreshold={assoc.get('gnn', {}).get('costThreshold', 'n/a')}",
-            f"  - JPDA: probabilistic association using clutterDensity={assoc.get('jpda', {}).get('clutterDensity', 'n/a')} and Pd={assoc.get('jpda', {}).get('detectionProbability', 'n/a')}",
+            f"  - Mahalanobis NN: greedy nearest-neighbor with distanceThreshold={_dig(cfg, 'association.mahalanobis.distanceThreshold')}",
+            f"  - GNN: global assignment (reduced-cost greedy/Hungarian-like) with costThreshold={_dig(cfg, 'association.gnn.costThreshold')}",
+            f"  - JPDA: probabilistic association using clutterDensity={_dig(cfg, 'association.jpda.clutterDensity')} and Pd={_dig(cfg, 'association.jpda.detectionProbability')}",
         ],
         theme,
     )
@@ -312,36 +500,29 @@ def build_deck() -> None:
     )
 
     # Slide 13: Track initiation + classification
-    tm = cfg.get("trackManagement", {})
-    init_cfg = (tm.get("initiation") or {})
-    maint_cfg = (tm.get("maintenance") or {})
-    del_cfg = (tm.get("deletion") or {})
     s = prs.slides.add_slide(blank)
     add_bullets(
         s,
         "Track initiation, maintenance, deletion, classification",
         [
-            f"Initiation: M-of-N candidates (m={init_cfg.get('m','?')}, n={init_cfg.get('n','?')}) on unmatched clusters; optional initial velocity from two-point differencing.",
-            f"Maintenance: confirmHits={maint_cfg.get('confirmHits','?')} and quality update (boost={maint_cfg.get('qualityBoost','?')}, decay={maint_cfg.get('qualityDecayRate','?')}).",
-            f"Deletion: maxCoastingDwells={del_cfg.get('maxCoastingDwells','?')}, minQuality={del_cfg.get('minQuality','?')}, maxRange={del_cfg.get('maxRange','?')}.",
+            f"Initiation: M-of-N candidates (m={_dig(cfg, 'trackManagement.initiation.m', '?')}, n={_dig(cfg, 'trackManagement.initiation.n', '?')}) on unmatched clusters; optional initial velocity from two-point differencing.",
+            f"Maintenance: confirmHits={_dig(cfg, 'trackManagement.maintenance.confirmHits', '?')} and quality update (boost={_dig(cfg, 'trackManagement.maintenance.qualityBoost', '?')}, decay={_dig(cfg, 'trackManagement.maintenance.qualityDecayRate', '?')}).",
+            f"Deletion: maxCoastingDwells={_dig(cfg, 'trackManagement.deletion.maxCoastingDwells', '?')}, minQuality={_dig(cfg, 'trackManagement.deletion.minQuality', '?')}, maxRange={_dig(cfg, 'trackManagement.deletion.maxRange', '?')}.",
             "Classification: simple heuristics using speed + IMM mode probabilities (clutter/drone/bird/unknown).",
         ],
         theme,
     )
 
     # Slide 14: Configuration layout
-    sys_cfg = cfg.get("system", {})
-    net_cfg = cfg.get("network", {})
-    cl_cfg = cfg.get("clustering", {})
     s = prs.slides.add_slide(blank)
     add_bullets(
         s,
         "Configuration (tracker_config.json) — key knobs",
         [
-            f"System: cyclePeriodMs={sys_cfg.get('cyclePeriodMs','?')}  maxDetectionsPerDwell={sys_cfg.get('maxDetectionsPerDwell','?')}  maxTracks={sys_cfg.get('maxTracks','?')}",
-            f"Network: receiver={net_cfg.get('receiverIp','?')}:{net_cfg.get('receiverPort','?')}  sender={net_cfg.get('senderIp','?')}:{net_cfg.get('senderPort','?')}",
-            f"Clustering: method={cl_cfg.get('method','?')}  •  DBSCAN eps(range/az/el)={cl_cfg.get('dbscan', {})}",
-            f"Association: method={assoc.get('method','?')}  gatingThreshold={assoc.get('gatingThreshold','?')}",
+            f"System: cyclePeriodMs={_dig(cfg, 'system.cyclePeriodMs', '?')}  maxDetectionsPerDwell={_dig(cfg, 'system.maxDetectionsPerDwell', '?')}  maxTracks={_dig(cfg, 'system.maxTracks', '?')}",
+            f"Network: receiver={_dig(cfg, 'network.receiverIp', '?')}:{_dig(cfg, 'network.receiverPort', '?')}  sender={_dig(cfg, 'network.senderIp', '?')}:{_dig(cfg, 'network.senderPort', '?')}",
+            f"Clustering: method={_dig(cfg, 'clustering.method', '?')}  •  DBSCAN eps(range/az/el)={_dig(cfg, 'clustering.dbscan', {})}",
+            f"Association: method={_dig(cfg, 'association.method', '?')}  gatingThreshold={_dig(cfg, 'association.gatingThreshold', '?')}",
             "Operational practice: keep config under version control; changes should be validated with simulators/log replay.",
         ],
         theme,
@@ -405,13 +586,113 @@ def build_deck() -> None:
         theme,
     )
 
-    OUT_PPTX.parent.mkdir(parents=True, exist_ok=True)
-    prs.save(str(OUT_PPTX))
+    save_deck(prs, OUT_PPTX, save_mode)
+
+
+class _PackageZipFile(zipfile.ZipFile):
+    """ZipFile that stores already-compressed media instead of re-deflating it."""
+
+    def writestr(self, zinfo_or_arcname, data, compress_type=None, compresslevel=None):
+        if (
+            compress_type is None
+            and isinstance(zinfo_or_arcname, str)
+            and zinfo_or_arcname.lower().endswith(PRECOMPRESSED_SUFFIXES)
+        ):
+            compress_type = zipfile.ZIP_STORED
+        super().writestr(zinfo_or_arcname, data, compress_type, compresslevel)
+
+
+@contextlib.contextmanager
+def _zip_settings(compression: int, compresslevel: Optional[int]) -> Iterator[None]:
+    """Temporarily override the zip settings python-pptx saves with.
+
+    python-pptx hard-codes ZIP_DEFLATED at zlib's default level in its private
+    ``_ZipPkgWriter``; its ``_zipf`` factory is swapped for the duration of a
+    save. If that internal ever moves, python-pptx's defaults are used.
+    """
+    writer = getattr(pptx_serialized, "_ZipPkgWriter", None)
+    original = vars(writer).get("_zipf") if writer is not None else None
+    if original is None:
+        yield
+        return
+
+    def _zipf(self) -> zipfile.ZipFile:
+        zipf = self.__dict__.get("_tuned_zipf")
+        if zipf is None:
+            zipf = self.__dict__["_tuned_zipf"] = _PackageZipFile(
+                self._pkg_file,
+                "w",
+                compression=compression,
+                compresslevel=compresslevel,
+                strict_timestamps=False,
+            )
+        return zipf
+
+    writer._zipf = property(_zipf)
+    try:
+        yield
+    finally:
+        writer._zipf = original
+
+
+def save_deck(prs, out_path: Path, mode: str = "default") -> None:
+    # Serialize in memory, then write the file once and swap it into place so
+    # a failed build never leaves a truncated deck behind.
+    buf = io.BytesIO()
+    with _zip_settings(*SAVE_MODES[mode]):
+        prs.save(buf)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    tmp_path.write_bytes(buf.getvalue())
+    tmp_path.replace(out_path)
+
+
+def _deck_is_up_to_date() -> bool:
+    if not OUT_PPTX.exists():
+        return False
+    inputs = [
+        *DIAGRAMS_DIR.glob("*.dot"),
+        *(p for ext in DIAGRAM_FORMATS for p in DIAGRAMS_DIR.glob(f"*{ext}")),
+        CONFIG_PATH,
+        Path(__file__),
+    ]
+    built = OUT_PPTX.stat().st_mtime
+    return all(p.stat().st_mtime <= built for p in inputs)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--fast",
+        dest="save_mode",
+        action="store_const",
+        const="fast",
+        help="store the .pptx uncompressed (quickest save, for local iteration; implies --force)",
+    )
+    mode.add_argument(
+        "--dist",
+        dest="save_mode",
+        action="store_const",
+        const="dist",
+        help="compress the .pptx at maximum deflate level (for distribution; implies --force)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="rebuild even if the deck is newer than all of its inputs",
+    )
+    parser.set_defaults(save_mode="default")
+    args = parser.parse_args(argv)
 
+    # The freshness check only compares mtimes, so it cannot tell which save
+    # mode produced the existing deck; --fast/--dist always rebuild.
+    if not args.force and args.save_mode == "default" and _deck_is_up_to_date():
+        print(f"Up-to-date: {OUT_PPTX}")
+        return 0
 
-def main() -> int:
-    render_diagrams()
-    build_deck()
+    _PNG_CACHE.update((png, png.read_bytes()) for png in render_diagrams())
+    build_deck(args.save_mode)
     print(f"Wrote: {OUT_PPTX}")
     return 0
 